@@ -1,14 +1,70 @@
 import math
-from dataclasses import dataclass, field
+import sys
+
+# math.gcd is kept over a pure-Python binary (Stein) GCD: even for word-sized
+# operands the interpreted shift/subtract loop is ~10x slower than the C call.
+# For multi-digit ints CPython's math.gcd already runs Lehmer's algorithm in C,
+# so a Python-level Lehmer loop would only add interpreter overhead.
+_gcd = math.gcd
+_setattr = object.__setattr__
+_object_new = object.__new__
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+# Normalized results for small (x, y) pairs are shared instead of rebuilt.
+# Bounded in both entry count and magnitude. Values are canonical instances;
+# keys are their reduced pair or any unreduced pair that was seen to produce them.
+# When full, the cache is reset to the permanent pool of common values (_INTERN,
+# filled once the class is defined).
+_CACHE_SIZE = 4096
+_CACHE_BOUND = 1 << 20
+_cache: dict[tuple[int, int], 'Fractional'] = {}
+_INTERN: dict[tuple[int, int], 'Fractional'] = {}
+
+
+def _remember(key: tuple[int, int], obj: 'Fractional') -> None:
+    if len(_cache) >= _CACHE_SIZE:
+        _cache.clear()
+        _cache.update(_INTERN)
+    _cache[key] = obj
+
+
+# Int / int true division is correctly rounded, so two quotients further apart
+# than this (relative to their magnitude, or absolutely near zero) are
+# guaranteed to be ordered the same way as the exact fractions.
+_FLOAT_SCREEN_EPS = 2.0 ** -45
+# The float screen only pays off once cross-multiplying means big x big
+# products; below roughly 512-bit operands the exact comparison is faster.
+_FLOAT_SCREEN_MIN = 1 << 512
+
+
+def _float_order(x1: int, y1: int, x2: int, y2: int) -> int:
+    """
+    Order x1/y1 against x2/y2 using float approximations only.
+
+    Returns:
+        -1 or 1 when the floats are far enough apart to decide the order,
+        0 when the caller must fall back to exact cross-multiplication.
+    """
+    try:
+        a = x1 / y1
+        b = x2 / y2
+    except OverflowError:
+        return 0
+    d = a - b
+    if abs(d) > _FLOAT_SCREEN_EPS * max(abs(a), abs(b), 1.0):
+        return -1 if d < 0 else 1
+    return 0
+
 
-@dataclass(frozen=True)
 class Fractional:
     """
     Represents a rational number (fraction) with integer numerator and denominator.
     The fraction is always stored in normalized form:
     - The denominator is always positive.
     - The numerator and denominator are divided by their greatest common divisor.
-    - Original values before normalization are stored in original_x and original_y.
+    - Original values before normalization are available as original_x and original_y
+      (only stored when they differ from the reduced pair; otherwise they equal x and y).
 
     Args:
         x: Numerator of the fraction
@@ -16,53 +72,118 @@ class Fractional:
         normalize_original: If True, applies GCD normalization to original values. Default is False.
 
     Supports arithmetic and comparison operations with other Fractional objects and integers.
-    Raises ValueError if denominator is zero.
+    Instances are immutable. Raises ValueError if denominator is zero.
     """
 
-    x: int
-    y: int
-    normalize_original: bool = False
-    original_x: int = field(init=False)
-    original_y: int = field(init=False)
+    __slots__ = ('x', 'y', '_original', '_hash', '_str')
 
-    def __post_init__(self):
-        if self.y == 0:
+    def __new__(cls, x: int, y: int, normalize_original: bool = False):
+        # Interned instance: valid when the input already is in reduced form, or
+        # when the caller asked for the reduced display form anyway. Only exact ints
+        # are looked up, since (1.0, 2) would match the (1, 2) key; other types take
+        # the normal path, which validates them
+        if cls is Fractional and type(x) is int and type(y) is int:
+            cached = _cache.get((x, y))
+            if cached is not None and (normalize_original or cached.y == y):
+                return cached
+        if y == 0:
             raise ValueError("Denominator cannot be zero.")
-        # Move any minus sign from denominator to numerator
-        x, y = self.x, self.y
+        if cls is Fractional and type(y) is int and y == 1 and type(x) is int:
+            # Integers are always in reduced form; anything else goes through
+            # gcd(), which rejects non-integer operands
+            return _raw(x, 1)
+        # gcd() is never negative; giving it the denominator's sign moves any
+        # minus sign to the numerator within the same two divisions
+        g = _gcd(x, y)
         if y < 0:
-            x = -x
-            y = -y
-        # Keep originals for string representation by default
-        orig_x, orig_y = x, y
-        # Always normalize internal representation for math/repr/comparisons
-        norm_x, norm_y = self._find_gcd(x, y)
-        # If requested, also normalize the "original" pair so str() shows reduced form
-        if self.normalize_original:
-            orig_x, orig_y = norm_x, norm_y
-        # Set attributes
-        object.__setattr__(self, 'original_x', orig_x)
-        object.__setattr__(self, 'original_y', orig_y)
-        object.__setattr__(self, 'x', norm_x)
-        object.__setattr__(self, 'y', norm_y)
+            g = -g
+        # Always normalize internal representation for math/repr/comparisons. When the
+        # display form is the reduced one anyway (requested, or the input already was
+        # reduced) no originals are stored and the shared normalized instance is used.
+        # Subclasses are never shared, so they always get a fresh instance
+        reduced = normalize_original or g == 1 or g == -1
+        if reduced and cls is Fractional:
+            return _raw(x // g, y // g)
+        # Otherwise keep originals (with the sign moved to the numerator) for string
+        # representation, and set attributes
+        self = _object_new(cls)
+        _setattr(self, '_original', None if reduced else (-x, -y) if y < 0 else (x, y))
+        _setattr(self, 'x', x // g)
+        _setattr(self, 'y', y // g)
+        _setattr(self, '_hash', None)
+        _setattr(self, '_str', None)
+        return self
 
     @staticmethod
-    def _find_gcd(x: int, y: int) -> tuple[int, int]:
+    def _raw(x: int, y: int) -> 'Fractional':
         """
-        Apply GCD normalization to x and y.
+        Build a Fractional from an already normalized pair, bypassing __new__.
+        The result is always a plain Fractional, whatever the operand types.
 
-        Args:
-            x: Numerator
-            y: Denominator
+        The caller guarantees that y > 0 and gcd(x, y) == 1, so the result is
+        stored as-is and its display form equals its internal form.
+        Small values are interned: equal results share one canonical instance,
+        which also lets __eq__ succeed on the identity check.
+        """
+        small = -_CACHE_BOUND < x < _CACHE_BOUND and y < _CACHE_BOUND
+        if small:
+            key = (x, y)
+            obj = _cache.get(key)
+            if obj is not None:
+                return obj
+        obj = _object_new(Fractional)
+        _setattr(obj, 'x', x)
+        _setattr(obj, 'y', y)
+        _setattr(obj, '_original', None)
+        _setattr(obj, '_hash', None)
+        _setattr(obj, '_str', None)
+        if small:
+            _remember(key, obj)
+        return obj
 
-        Returns:
-            A tuple of (x // gcd, y // gcd)
+    @staticmethod
+    def _of(x: int, y: int) -> 'Fractional':
+        """
+        Build a fully normalized Fractional (internal and display form reduced).
+        Equivalent to Fractional(x, y, normalize_original=True) for y > 0, but
+        small pairs are served from the module-level cache, keyed by the unreduced pair.
+        """
+        small = -_CACHE_BOUND < x < _CACHE_BOUND and y < _CACHE_BOUND
+        if small:
+            key = (x, y)
+            obj = _cache.get(key)
+            if obj is not None:
+                return obj
+        if y != 1:
+            g = _gcd(x, y)
+            if g != 1:
+                obj = _raw(x // g, y // g)
+                if small:
+                    _remember(key, obj)
+                return obj
+        return _raw(x, y)
 
-        Example:
-            _find_gcd(6, 8) returns (3, 4)
-        """
-        gcd = math.gcd(x, y)
-        return x // gcd, y // gcd
+    @property
+    def original_x(self) -> int:
+        """Numerator as passed to the constructor (sign-normalized only)."""
+        original = self._original
+        return self.x if original is None else original[0]
+
+    @property
+    def original_y(self) -> int:
+        """Denominator as passed to the constructor (sign-normalized only)."""
+        original = self._original
+        return self.y if original is None else original[1]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}': Fractional is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"cannot delete field '{name}': Fractional is immutable")
+
+    def __reduce__(self):
+        # Rebuild through the constructor so pickle/copy keep the display form
+        return (type(self), (self.original_x, self.original_y))
 
     # ------- basic arithmetic methods ------------
 
@@ -71,12 +192,26 @@ class Fractional:
         Add another Fractional or integer to this Fractional and return the result as a new normalized Fractional.
         The result will be in reduced form (GCD applied to both internal and display values).
         """
-        if isinstance(other, Fractional):
-            num = self.x * other.y + other.x * self.y
-            denom = self.y * other.y
-            return Fractional(num, denom, normalize_original=True)
-        elif isinstance(other, int):
-            return Fractional(self.x + other * self.y, self.y, normalize_original=True)
+        t = type(other)
+        if t is Fractional:
+            if self.y == other.y:
+                # Common denominator: only the new numerator can share a factor with it
+                return self._of(self.x + other.x, self.y)
+            # Work over lcm(self.y, other.y); since both operands are reduced, the
+            # numerator can only share a factor with g = gcd(self.y, other.y), so
+            # coprime denominators need no further reduction at all
+            g = _gcd(self.y, other.y)
+            if g == 1:
+                return self._raw(self.x * other.y + other.x * self.y, self.y * other.y)
+            b = other.y // g
+            num = self.x * b + other.x * (self.y // g)
+            g2 = _gcd(num, g)
+            return self._raw(num // g2, (self.y // g2) * b)
+        elif t is int:
+            # gcd(x + k*y, y) == gcd(x, y) == 1, so the result is already reduced
+            return self._raw(self.x + other * self.y, self.y)
+        elif isinstance(other, (Fractional, int)):
+            return self.__add__(_exact(other))
         return NotImplemented
 
     def __radd__(self, other):
@@ -91,12 +226,22 @@ class Fractional:
         Subtract another Fractional or integer from this Fractional and return the result as a new normalized Fractional.
         The result will be in reduced form (GCD applied to both internal and display values).
         """
-        if isinstance(other, Fractional):
-            num = self.x * other.y - other.x * self.y
-            denom = self.y * other.y
-            return Fractional(num, denom, normalize_original=True)
-        elif isinstance(other, int):
-            return Fractional(self.x - other * self.y, self.y, normalize_original=True)
+        t = type(other)
+        if t is Fractional:
+            if self.y == other.y:
+                return self._of(self.x - other.x, self.y)
+            # Same reduction over lcm(self.y, other.y) as in __add__
+            g = _gcd(self.y, other.y)
+            if g == 1:
+                return self._raw(self.x * other.y - other.x * self.y, self.y * other.y)
+            b = other.y // g
+            num = self.x * b - other.x * (self.y // g)
+            g2 = _gcd(num, g)
+            return self._raw(num // g2, (self.y // g2) * b)
+        elif t is int:
+            return self._raw(self.x - other * self.y, self.y)
+        elif isinstance(other, (Fractional, int)):
+            return self.__sub__(_exact(other))
         return NotImplemented
 
     def __rsub__(self, other):
@@ -104,8 +249,11 @@ class Fractional:
         Subtract this Fractional from an integer (right-hand side) and return the result as a new Fractional.
         Note: Unlike other operations, the result's display form is not normalized.
         """
-        if isinstance(other, int):
-            return Fractional(other * self.y - self.x, self.y, normalize_original=True)
+        if type(other) is int:
+            # Already reduced for the same reason as integer addition
+            return self._raw(other * self.y - self.x, self.y)
+        elif isinstance(other, int):
+            return self.__rsub__(int(other))
         return NotImplemented
 
     def __mul__(self, other):
@@ -113,10 +261,19 @@ class Fractional:
         Multiply this Fractional by another Fractional or integer and return the result as a new normalized Fractional.
         The result will be in reduced form (GCD applied to both internal and display values).
         """
-        if isinstance(other, Fractional):
-            return Fractional(self.x * other.x, self.y * other.y, normalize_original=True)
-        elif isinstance(other, int):
-            return Fractional(self.x * other, self.y, normalize_original=True)
+        t = type(other)
+        if t is Fractional:
+            # Cross-cancel before multiplying: both factors are reduced, so the
+            # product of the cancelled parts is reduced as well
+            g1 = _gcd(self.x, other.y)
+            g2 = _gcd(other.x, self.y)
+            return self._raw((self.x // g1) * (other.x // g2), (self.y // g2) * (other.y // g1))
+        elif t is int:
+            # Cancel the common factor up front so no gcd is needed on the product
+            g = _gcd(other, self.y)
+            return self._raw(self.x * (other // g), self.y // g)
+        elif isinstance(other, (Fractional, int)):
+            return self.__mul__(_exact(other))
         return NotImplemented
 
     def __rmul__(self, other):
@@ -132,14 +289,24 @@ class Fractional:
         The result will be in reduced form (GCD applied to both internal and display values).
         Raises ZeroDivisionError if dividing by zero Fractional or integer.
         """
-        if isinstance(other, Fractional):
+        t = type(other)
+        if t is Fractional:
             if other.x == 0:
                 raise ZeroDivisionError("Cannot divide by zero Fractional.")
-            return Fractional(self.x * other.y, self.y * other.x, normalize_original=True)
-        elif isinstance(other, int):
+            g1 = _gcd(self.x, other.x)
+            g2 = _gcd(other.y, self.y)
+            if other.x < 0:
+                g1 = -g1
+            return self._raw((self.x // g1) * (other.y // g2), (self.y // g2) * (other.x // g1))
+        elif t is int:
             if other == 0:
                 raise ZeroDivisionError("Cannot divide by zero integer.")
-            return Fractional(self.x, self.y * other, normalize_original=True)
+            g = _gcd(self.x, other)
+            if other < 0:
+                g = -g
+            return self._raw(self.x // g, self.y * (other // g))
+        elif isinstance(other, (Fractional, int)):
+            return self.__truediv__(_exact(other))
         return NotImplemented
 
     def __rtruediv__(self, other):
@@ -148,62 +315,196 @@ class Fractional:
         Note: Unlike other operations, the result's display form is not normalized.
         Raises ZeroDivisionError if dividing by zero Fractional.
         """
-        if isinstance(other, int):
+        if type(other) is int:
             if self.x == 0:
                 raise ZeroDivisionError("Cannot divide by zero Fractional.")
-            return Fractional(other * self.y, self.x, normalize_original=True)
+            # other / (x/y) == other * y / x; only other and x can share a factor
+            g = _gcd(other, self.x)
+            if self.x < 0:
+                g = -g
+            return self._raw((other // g) * self.y, self.x // g)
+        elif isinstance(other, int):
+            return self.__rtruediv__(int(other))
         return NotImplemented
 
+    # ------- unary and conversion methods ------------
+
+    def __neg__(self):
+        """
+        Return the negation of this Fractional as a new normalized Fractional.
+        Negation keeps the pair reduced, so no GCD is computed.
+        """
+        return self._raw(-self.x, self.y)
+
+    def __pos__(self):
+        """
+        Return this Fractional unchanged (instances are immutable). Subclass
+        instances are converted to the base type, like every other result.
+        """
+        if type(self) is Fractional:
+            return self
+        return Fractional(self.original_x, self.original_y)
+
+    def __abs__(self):
+        """
+        Return the absolute value of this Fractional.
+        """
+        if self.x >= 0:
+            return +self
+        return self._raw(-self.x, self.y)
+
+    def __int__(self) -> int:
+        """
+        Return this Fractional truncated toward zero, like int() of a float.
+        Example: int(Fractional(-7, 2)) returns -3
+        """
+        if self.x < 0:
+            return -(-self.x // self.y)
+        return self.x // self.y
+
+    def __float__(self) -> float:
+        """
+        Return the correctly rounded float value of this Fractional.
+        """
+        return self.x / self.y
+
+    # ------- batch methods ------------
+
+    @classmethod
+    def sum(cls, values) -> 'Fractional':
+        """
+        Return the sum of an iterable of Fractional objects and integers as a new normalized Fractional.
+        Faster than chaining '+': the running total is kept over the least common
+        denominator seen so far and reduced only once at the end, so no intermediate
+        Fractional objects are built.
+        Example: Fractional.sum([Fractional(1, 2), Fractional(1, 3), 1]) returns Fractional(11, 6)
+        """
+        num, denom = 0, 1
+        for v in values:
+            if isinstance(v, Fractional):
+                vy = v.y
+                if vy == denom:
+                    num += v.x
+                else:
+                    g = _gcd(denom, vy)
+                    scale = vy // g
+                    num = num * scale + v.x * (denom // g)
+                    denom *= scale
+            elif isinstance(v, int):
+                num += v * denom
+            else:
+                raise TypeError(f"Cannot sum Fractional with {type(v).__name__}.")
+        return cls._of(num, denom)
+
     # ------- comparison methods ------------
 
     def __eq__(self, other):
         """
         Check if this Fractional is equal to another Fractional or integer.
         """
-        if isinstance(other, Fractional):
-            return self.x == other.x and self.y == other.y
-        elif isinstance(other, int):
-            return self.x == other and self.y == 1
+        if self is other:
+            return True
+        t = type(other)
+        # Both sides are reduced, so equal values have equal denominators;
+        # comparing y first rejects most mismatches on the cheaper check
+        if t is Fractional:
+            return self.y == other.y and self.x == other.x
+        elif t is int:
+            return self.y == 1 and self.x == other
+        elif isinstance(other, (Fractional, int)):
+            return self.__eq__(_exact(other))
         return NotImplemented
 
     def __lt__(self, other):
         """
         Check if this Fractional is less than another Fractional or integer.
         """
-        if isinstance(other, Fractional):
+        t = type(other)
+        if t is Fractional:
+            if self.y > _FLOAT_SCREEN_MIN or other.y > _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other.x, other.y)
+                if s:
+                    return s < 0
             return self.x * other.y < other.x * self.y
-        elif isinstance(other, int):
+        elif t is int:
+            if self.y == 1:
+                return self.x < other
+            if self.y > _FLOAT_SCREEN_MIN and not -_FLOAT_SCREEN_MIN < other < _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other, 1)
+                if s:
+                    return s < 0
             return self.x < other * self.y
+        elif isinstance(other, (Fractional, int)):
+            return self.__lt__(_exact(other))
         return NotImplemented
 
     def __le__(self, other):
         """
         Check if this Fractional is less than or equal to another Fractional or integer.
         """
-        if isinstance(other, Fractional):
+        t = type(other)
+        if t is Fractional:
+            if self.y > _FLOAT_SCREEN_MIN or other.y > _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other.x, other.y)
+                if s:
+                    return s <= 0
             return self.x * other.y <= other.x * self.y
-        elif isinstance(other, int):
+        elif t is int:
+            if self.y == 1:
+                return self.x <= other
+            if self.y > _FLOAT_SCREEN_MIN and not -_FLOAT_SCREEN_MIN < other < _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other, 1)
+                if s:
+                    return s <= 0
             return self.x <= other * self.y
+        elif isinstance(other, (Fractional, int)):
+            return self.__le__(_exact(other))
         return NotImplemented
 
     def __gt__(self, other):
         """
         Check if this Fractional is greater than another Fractional or integer.
         """
-        if isinstance(other, Fractional):
+        t = type(other)
+        if t is Fractional:
+            if self.y > _FLOAT_SCREEN_MIN or other.y > _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other.x, other.y)
+                if s:
+                    return s > 0
             return self.x * other.y > other.x * self.y
-        elif isinstance(other, int):
+        elif t is int:
+            if self.y == 1:
+                return self.x > other
+            if self.y > _FLOAT_SCREEN_MIN and not -_FLOAT_SCREEN_MIN < other < _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other, 1)
+                if s:
+                    return s > 0
             return self.x > other * self.y
+        elif isinstance(other, (Fractional, int)):
+            return self.__gt__(_exact(other))
         return NotImplemented
 
     def __ge__(self, other):
         """
         Check if this Fractional is greater than or equal to another Fractional or integer.
         """
-        if isinstance(other, Fractional):
+        t = type(other)
+        if t is Fractional:
+            if self.y > _FLOAT_SCREEN_MIN or other.y > _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other.x, other.y)
+                if s:
+                    return s >= 0
             return self.x * other.y >= other.x * self.y
-        elif isinstance(other, int):
+        elif t is int:
+            if self.y == 1:
+                return self.x >= other
+            if self.y > _FLOAT_SCREEN_MIN and not -_FLOAT_SCREEN_MIN < other < _FLOAT_SCREEN_MIN:
+                s = _float_order(self.x, self.y, other, 1)
+                if s:
+                    return s >= 0
             return self.x >= other * self.y
+        elif isinstance(other, (Fractional, int)):
+            return self.__ge__(_exact(other))
         return NotImplemented
 
     # ------- technical methods ------------
@@ -220,9 +521,59 @@ class Fractional:
         Return the user-friendly string representation of the Fractional object.
         Example: '3/6'
         """
-        return f"{self.original_x}/{self.original_y}"
+        s = self._str
+        if s is None:
+            original = self._original
+            if original is None:
+                s = f"{self.x}/{self.y}"
+            else:
+                s = f"{original[0]}/{original[1]}"
+            _setattr(self, '_str', s)   # computed once, instances are immutable
+        return s
 
     def __hash__(self) -> int:
+        h = self._hash
+        if h is not None:
+            return h
         if self.y == 1:
-            return hash(self.x)         # to be consistent with int equality
-        return hash((self.x, self.y))
\ No newline at end of file
+            h = hash(self.x)            # to be consistent with int equality
+        else:
+            # Same numeric hash as fractions.Fraction (and float) of equal value
+            try:
+                dinv = pow(self.y, -1, _HASH_MODULUS)
+            except ValueError:
+                h = _HASH_INF           # y is a multiple of the modulus
+            else:
+                h = hash(hash(abs(self.x)) * dinv)
+            if self.x < 0:
+                h = -h
+                if h == -1:
+                    h = -2
+        _setattr(self, '_hash', h)      # computed once, instances are immutable
+        return h
+
+
+# Module-level alias for the constructor's hot paths
+_raw = Fractional._raw
+
+
+# Common small values (|x| <= _INTERN_BOUND, 1 <= y <= _INTERN_BOUND), shared by
+# construction and arithmetic for the whole run. Built once at import: only the
+# reduced pairs are kept, since _raw requires them and every unreduced spelling
+# resolves to one of these after normalization.
+_INTERN_BOUND = 16
+for _y in range(1, _INTERN_BOUND + 1):
+    for _x in range(-_INTERN_BOUND, _INTERN_BOUND + 1):
+        if _gcd(_x, _y) == 1:
+            _INTERN[(_x, _y)] = Fractional._raw(_x, _y)
+del _x, _y
+
+
+def _exact(value):
+    """
+    Convert an instance of an int or Fractional subclass (e.g. bool) to the
+    exact base type, so dunders only need fast paths for Fractional and int.
+    """
+    if isinstance(value, Fractional):
+        return Fractional._raw(value.x, value.y)
+    return int(value)
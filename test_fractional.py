@@ -1,6 +1,83 @@
+import copy
+import operator
+import pickle
 import pytest
+from fractions import Fraction
+import fractional
 from fractional import Fractional
 
+# Operands shared by the arithmetic and comparison tables, built once
+HALF = Fractional(1, 2)
+THIRD = Fractional(1, 3)
+QUARTER = Fractional(1, 4)
+MINUS_QUARTER = Fractional(-1, 4)
+FIFTH = Fractional(1, 5)
+TWO_FIFTHS = Fractional(2, 5)
+
+def _ids(cases, op):
+    return [f"{a}{op}{b}" for a, b, *_ in cases]
+
+CASES_ADD = [
+    (HALF, THIRD, Fractional(5, 6)),
+    (TWO_FIFTHS, FIFTH, Fractional(3, 5)),
+    (MINUS_QUARTER, HALF, QUARTER),
+    (Fractional(1, 6), Fractional(1, 10), Fractional(4, 15)),
+    (Fractional(1, 6), THIRD, HALF),
+    # with int
+    (HALF, 1, Fractional(3, 2)),
+    (1, HALF, Fractional(3, 2)),
+    (TWO_FIFTHS, 2, Fractional(12, 5)),
+    (MINUS_QUARTER, 1, Fractional(3, 4)),
+]
+
+CASES_SUB = [
+    (HALF, THIRD, Fractional(1, 6)),
+    (Fractional(3, 4), QUARTER, HALF),
+    (TWO_FIFTHS, FIFTH, FIFTH),
+    # with int
+    (HALF, 1, Fractional(-1, 2)),
+    (1, HALF, HALF),
+    (TWO_FIFTHS, 2, Fractional(-8, 5)),
+    (MINUS_QUARTER, 1, Fractional(-5, 4)),
+]
+
+CASES_MUL = [
+    (HALF, THIRD, Fractional(1, 6), '1/6'),
+    (TWO_FIFTHS, Fractional(5, 2), Fractional(1, 1), '1/1'),
+    (MINUS_QUARTER, Fractional(2, 3), Fractional(-1, 6), '-1/6'),
+    # with int
+    (QUARTER, 4, 1, "1/1"),
+    (HALF, 2, Fractional(1, 1), "1/1"),
+    (2, HALF, Fractional(1, 1), "1/1"),
+    (TWO_FIFTHS, 5, Fractional(2, 1), "2/1"),
+    (MINUS_QUARTER, 2, Fractional(-1, 2), "-1/2"),
+]
+
+CASES_TRUEDIV = [
+    (HALF, THIRD, Fractional(3, 2)),
+    (TWO_FIFTHS, FIFTH, Fractional(2, 1)),
+    (MINUS_QUARTER, Fractional(2, 3), Fractional(-3, 8)),
+    (QUARTER, HALF, HALF),
+    # with int
+    (HALF, 2, QUARTER),
+    (2, HALF, Fractional(4, 1)),
+    (TWO_FIFTHS, 2, FIFTH),
+    (MINUS_QUARTER, 2, Fractional(-1, 8)),
+]
+
+CASES_COMPARISONS = [
+    (Fractional(2, 4), HALF, True),
+    (THIRD, HALF, True),
+    (HALF, Fractional(2, 4), True),
+    (Fractional(3, 4), Fractional(2, 3), True),
+    (Fractional(3, 4), Fractional(3, 4), True),
+    # with int
+    (HALF, 1, False),
+    (Fractional(3, 2), 1, True),
+    (TWO_FIFTHS, 0, True),
+    (MINUS_QUARTER, 0, False),
+]
+
 @pytest.mark.parametrize(
     "x, y, normalize, exp_x, exp_y, exp_orig_x, exp_orig_y, exp_str",
     [
@@ -22,104 +99,198 @@ def test_initializer_parametrized(x, y, normalize, exp_x, exp_y, exp_orig_x, exp
     assert (f.original_x, f.original_y) == (exp_orig_x, exp_orig_y)
     assert str(f) == exp_str
 
-@pytest.mark.parametrize(
-    "a, b, expected",
-    [
-        (Fractional(1, 2), Fractional(1, 3), Fractional(5, 6)),
-        (Fractional(2, 5), Fractional(1, 5), Fractional(3, 5)),
-        (Fractional(-1, 4), Fractional(1, 2), Fractional(1, 4)),
-        # with int
-        (Fractional(1, 2), 1, Fractional(3, 2)),
-        (1, Fractional(1, 2), Fractional(3, 2)),
-        (Fractional(2, 5), 2, Fractional(12, 5)),
-        (Fractional(-1, 4), 1, Fractional(3, 4)),
-    ]
-)
+@pytest.mark.parametrize("a, b, expected", CASES_ADD, ids=_ids(CASES_ADD, "+"))
 def test_add(a, b, expected):
     assert a + b == expected
 
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "values, expected",
     [
-        (Fractional(1, 2), Fractional(1, 3), Fractional(1, 6)),
-        (Fractional(3, 4), Fractional(1, 4), Fractional(1, 2)),
-        (Fractional(2, 5), Fractional(1, 5), Fractional(1, 5)),
-        # with int
-        (Fractional(1, 2), 1, Fractional(-1, 2)),
-        (1, Fractional(1, 2), Fractional(1, 2)),
-        (Fractional(2, 5), 2, Fractional(-8, 5)),
-        (Fractional(-1, 4), 1, Fractional(-5, 4)),
+        ([], Fractional(0, 1)),
+        ([Fractional(1, 2), Fractional(1, 3), 1], Fractional(11, 6)),
+        ([Fractional(1, 4)] * 4, Fractional(1, 1)),
+        ([Fractional(1, 6), Fractional(-1, 4), Fractional(5, 12)], Fractional(1, 3)),
+        ([2, Fractional(3, 10 ** 20), -2], Fractional(3, 10 ** 20)),
     ]
 )
+def test_sum(values, expected):
+    result = Fractional.sum(values)
+    assert result == expected
+    assert str(result) == f"{expected.x}/{expected.y}"
+
+def test_sum_rejects_other_types():
+    with pytest.raises(TypeError):
+        Fractional.sum([Fractional(1, 2), 0.5])
+
+@pytest.mark.parametrize("a, b, expected", CASES_SUB, ids=_ids(CASES_SUB, "-"))
 def test_sub(a, b, expected):
     assert a - b == expected
 
-@pytest.mark.parametrize(
-    "a, b, expected, expected_str",
-    [
-        (Fractional(1, 2), Fractional(1, 3), Fractional(1, 6), '1/6'),
-        (Fractional(2, 5), Fractional(5, 2), Fractional(1, 1), '1/1'),
-        (Fractional(-1, 4), Fractional(2, 3), Fractional(-1, 6), '-1/6'),
-        # with int
-        (Fractional(1, 4), 4, 1, "1/1"),
-        (Fractional(1, 2), 2, Fractional(1, 1), "1/1"),
-        (2, Fractional(1, 2), Fractional(1, 1), "1/1"),
-        (Fractional(2, 5), 5, Fractional(2, 1), "2/1"),
-        (Fractional(-1, 4), 2, Fractional(-1, 2), "-1/2"),
-    ]
-)
+@pytest.mark.parametrize("a, b, expected, expected_str", CASES_MUL, ids=_ids(CASES_MUL, "*"))
 def test_mul(a, b, expected, expected_str):
     assert a * b == expected
     assert str(a * b) == expected_str
 
+@pytest.mark.parametrize("a, b, expected", CASES_TRUEDIV, ids=_ids(CASES_TRUEDIV, "/"))
+def test_truediv(a, b, expected):
+    assert a / b == expected
+
+def _as_fraction(v):
+    return Fraction(v.x, v.y) if isinstance(v, Fractional) else Fraction(v)
+
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "cases, op",
     [
-        (Fractional(1, 2), Fractional(1, 3), Fractional(3, 2)),
-        (Fractional(2, 5), Fractional(1, 5), Fractional(2, 1)),
-        (Fractional(-1, 4), Fractional(2, 3), Fractional(-3, 8)),
-        (Fractional(1, 4), Fractional(1, 2), Fractional(1, 2)),
-        # with int
-        (Fractional(1, 2), 2, Fractional(1, 4)),
-        (2, Fractional(1, 2), Fractional(4, 1)),
-        (Fractional(2, 5), 2, Fractional(1, 5)),
-        (Fractional(-1, 4), 2, Fractional(-1, 8)),
-    ]
+        (CASES_ADD, operator.add),
+        (CASES_SUB, operator.sub),
+        (CASES_MUL, operator.mul),
+        (CASES_TRUEDIV, operator.truediv),
+    ],
+    ids=["add", "sub", "mul", "truediv"],
 )
-def test_truediv(a, b, expected):
-    assert a / b == expected
+def test_cases_match_fraction(cases, op):
+    # the hand-written expected values agree with fractions.Fraction as an independent oracle
+    for a, b, expected, *_ in cases:
+        assert op(_as_fraction(a), _as_fraction(b)) == _as_fraction(expected)
 
 @pytest.mark.parametrize(
-    "a, b, expected",
+    "frac, neg, absolute, as_int, as_float",
     [
-        (Fractional(2, 4), Fractional(1, 2), True),
-        (Fractional(1, 3), Fractional(1, 2), True),
-        (Fractional(1, 2), Fractional(2, 4), True),
-        (Fractional(3, 4), Fractional(2, 3), True),
-        (Fractional(3, 4), Fractional(3, 4), True),
-        # with int
-        (Fractional(1, 2), 1, False),
-        (Fractional(3, 2), 1, True),
-        (Fractional(2, 5), 0, True),
-        (Fractional(-1, 4), 0, False),
+        (Fractional(1, 2), Fractional(-1, 2), Fractional(1, 2), 0, 0.5),
+        (Fractional(-7, 2), Fractional(7, 2), Fractional(7, 2), -3, -3.5),
+        (Fractional(9, 3), Fractional(-3, 1), Fractional(3, 1), 3, 3.0),
+        (Fractional(0, 5), Fractional(0, 1), Fractional(0, 1), 0, 0.0),
+        (Fractional(1, 3), Fractional(-1, 3), Fractional(1, 3), 0, 1 / 3),
     ]
 )
+def test_unary_and_conversions(frac, neg, absolute, as_int, as_float):
+    assert -frac == neg
+    assert str(-frac) == f"{neg.x}/{neg.y}"
+    assert +frac is frac
+    assert abs(frac) == absolute
+    assert int(frac) == as_int
+    assert float(frac) == as_float
+
+@pytest.mark.parametrize("a, b, expected", CASES_COMPARISONS, ids=_ids(CASES_COMPARISONS, " vs "))
 def test_comparisons(a, b, expected):
     # eq, lt, le, gt, ge
     if isinstance(b, Fractional):
-        assert (a == b) == (a.x * b.y == b.x * a.y)
-        assert (a < b) == (a.x * b.y < b.x * a.y)
-        assert (a <= b) == (a.x * b.y <= b.x * a.y)
-        assert (a > b) == (a.x * b.y > b.x * a.y)
-        assert (a >= b) == (a.x * b.y >= b.x * a.y)
+        # the sign of a - b decides every operator
+        d = a.x * b.y - b.x * a.y
+        assert (a == b) == (d == 0)
+        assert (a < b) == (d < 0)
+        assert (a <= b) == (d <= 0)
+        assert (a > b) == (d > 0)
+        assert (a >= b) == (d >= 0)
     else:
         assert (a > b) == expected
 
+@pytest.mark.parametrize(
+    "a, b, equal",
+    [
+        (Fractional(6, 4), Fractional(9, 6), True),
+        (Fractional(3 * 10**40, 10**40), 3, True),
+        (Fractional(-2 * 7**50, 7**50), -2, True),
+        (Fractional(7**50 + 1, 7**50), 1, False),
+        (Fractional(1, 3), Fractional(2, 3), False),
+        (Fractional(1, 3), Fractional(1, 4), False),
+    ]
+)
+def test_eq_on_reduced_form(a, b, equal):
+    # equality compares the reduced (x, y) pairs directly, no cross-multiplication
+    assert (a == b) == equal
+    assert (b == a) == equal
+    assert (a != b) != equal
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        # indistinguishable as floats
+        (Fractional(10**30 + 1, 10**30), Fractional(10**30, 10**30 - 1)),
+        (Fractional(-1, 10**400), Fractional(-1, 10**401)),
+        # out of float range
+        (Fractional(10**400 - 1, 1), Fractional(10**400, 1)),
+        (Fractional(-10**400, 3), Fractional(1, 3)),
+        # big enough for the float screen
+        (Fractional(3**700, 2**1100), Fractional(5**500, 3**650)),
+        (Fractional(3**401, 2**1100), 3**400),
+        (-(2**600), Fractional(-(7**400), 2**1000)),
+        (-(10**400), Fractional(10**700 + 1, 3**600)),
+        # screened, but too close for floats: the exact comparison decides
+        (Fractional(3**700, 2**1100), Fractional(3**700 + 1, 2**1100)),
+        (Fractional(3**400 * 2**1100 - 1, 2**1100), 3**400),
+    ],
+    ids=[
+        "close-near-one", "close-near-zero", "huge-integral", "huge-negative",
+        "screened", "screened-vs-int", "int-vs-screened", "huge-int-vs-screened",
+        "screened-close", "screened-close-vs-int",
+    ],
+)
+def test_comparisons_exact(a, b):
+    assert a < b and a <= b and not a > b and not a >= b
+    assert b > a and b >= a and not b < a and not b <= a
+
 # Edge cases
 def test_zero_denominator():
     with pytest.raises(ValueError):
         Fractional(1, 0)
 
+@pytest.mark.parametrize("x, y", [(1.5, 1), (1.5, 2), (1, 2.5), (1.0, 2), (3, 2.0), (100, 3.0), (3, 1.0), (3, -1.0)])
+def test_non_integer_rejected(x, y):
+    with pytest.raises(TypeError):
+        Fractional(x, y)
+
+def test_immutable():
+    f = Fractional(1, 2)
+    with pytest.raises(AttributeError):
+        f.x = 3
+    with pytest.raises(AttributeError):
+        del f.y
+    assert not hasattr(f, '__dict__')
+
+@pytest.mark.parametrize("frac", [Fractional(2, 4), Fractional(1, 2), Fractional(-3, 7)])
+def test_pickle_and_copy(frac):
+    for clone in (pickle.loads(pickle.dumps(frac)), copy.copy(frac), copy.deepcopy(frac)):
+        assert clone == frac
+        assert str(clone) == str(frac)
+        assert (clone.original_x, clone.original_y) == (frac.original_x, frac.original_y)
+
+def test_small_results_are_shared():
+    a = Fractional(1, 2) + Fractional(1, 3)
+    b = Fractional(1, 3) + Fractional(1, 2)
+    assert a is b
+    assert Fractional(2, 3) * Fractional(3, 4) is Fractional(1, 4) * 2
+    big = Fractional(1, 2 ** 40) + Fractional(1, 3)
+    assert big is not Fractional(1, 2 ** 40) + Fractional(1, 3)
+    assert big == Fractional(1, 2 ** 40) + Fractional(1, 3)
+
+def test_subclass_operands():
+    class Half(Fractional):
+        __slots__ = ()
+
+    assert Fractional(1, 2) + True == Fractional(3, 2)
+    assert True - Fractional(1, 2) == Fractional(1, 2)
+    assert Fractional(1, 1) == True
+    assert Fractional(1, 2) * Half(1, 2) == Fractional(1, 4)
+    assert Fractional(1, 3) < Half(1, 2)
+    # results are always the base type, whichever side the subclass is on
+    for result in (Half(1, 2) + Fractional(1, 2), Fractional(1, 2) + Half(1, 3),
+                   Half(1, 3) * 2, 2 / Half(1, 3), -Half(1, 2), abs(Half(-1, 2)),
+                   Half(1, 2) - Half(1, 3), Fractional.sum([Half(1, 2), 1])):
+        assert type(result) is Fractional
+    assert type(Half(1, 2)) is Half and type(Half(2, 4)) is Half
+    assert Half(1, 2) is not Fractional(1, 2)
+
+def test_reduced_constructions_are_interned():
+    assert Fractional(1, 2) is Fractional(1, 2)
+    assert Fractional(-1, 2) is Fractional(1, -2)
+    assert Fractional(2, 4, True) is Fractional(1, 2)
+    assert Fractional(-15, 16) is Fractional(15, -16)
+    assert Fractional(-15, 16) is fractional._INTERN[(-15, 16)]
+    # an unreduced display form cannot be shared
+    assert Fractional(2, 4) is not Fractional(1, 2)
+    assert str(Fractional(2, 4)) == "2/4"
+
 def test_zero_numerator():
     assert Fractional(0, 5) == Fractional(0, 1)
 
@@ -164,7 +335,7 @@ def test_str(frac, expected_str):
 )
 def test_str_representation(frac1, frac2, expected_str):
     result = frac1 + frac2
-    actual_str = f"{str(frac1)} + {str(frac2)} = {str(result)}"
+    actual_str = f"{frac1!s} + {frac2!s} = {result!s}"
     assert actual_str == expected_str
 
 def test_normalized_result_after_subtraction():
@@ -199,4 +370,13 @@ def test_normalized_result_after_int_division():
     ],
 )
 def test_hash(left, right):
-    assert hash(left) == hash(right)
\ No newline at end of file
+    assert hash(left) == hash(right)
+
+@pytest.mark.parametrize(
+    "x, y",
+    [(1, 2), (-1, 2), (2, 3), (-7, 3), (5, 1), (0, 1), (1, 2 ** 61 - 1), (-3, 2 ** 62 - 2), (10 ** 30, 7)],
+)
+def test_hash_matches_fraction(x, y):
+    f = Fractional(x, y)
+    assert hash(f) == hash(Fraction(x, y))
+    assert hash(f) == hash(f)       # memoized value is stable